@@ -5,6 +5,26 @@ from PyQt5.QtWidgets import QFileDialog, QMessageBox, QPushButton, QHBoxLayout
 import pdfmerge
 
 
+class MergeWorker(QtCore.QObject):
+    progress = QtCore.pyqtSignal(int, int)
+    finished = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, files, out_path):
+        super().__init__()
+        self.files = files
+        self.out_path = out_path
+
+    @QtCore.pyqtSlot()
+    def run(self):
+        try:
+            pdfmerge.merge_pdfs(self.files, self.out_path, progress=self.progress.emit)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.finished.emit(self.out_path)
+
+
 class UiPDFMerger(object):
     def setupUi(self, PDFMerger):
         PDFMerger.setObjectName("PDFMerger")
@@ -21,6 +41,11 @@ class UiPDFMerger(object):
         self.listWidget = QtWidgets.QListWidget(self.centralwidget)
         self.listWidget.setGeometry(QtCore.QRect(20, 30, 331, 192))
         self.listWidget.setObjectName("listWidget")
+        # Paths in list order, kept in step with listWidget
+        self.file_paths = []
+        # Running merge, if any; cleared once its thread has stopped
+        self._thread = None
+        self._worker = None
 
         # Add Files
         self.btnAdd = QtWidgets.QPushButton(self.centralwidget)
@@ -61,6 +86,12 @@ class UiPDFMerger(object):
         self.outputFile.setGeometry(QtCore.QRect(20, 280, 331, 31))
         self.outputFile.setObjectName("outputFile")
 
+        # Merge progress
+        self.progressBar = QtWidgets.QProgressBar(self.centralwidget)
+        self.progressBar.setGeometry(QtCore.QRect(290, 340, 161, 23))
+        self.progressBar.setObjectName("progressBar")
+        self.progressBar.hide()
+
         PDFMerger.setCentralWidget(self.centralwidget)
         self.menubar = QtWidgets.QMenuBar(PDFMerger)
         self.menubar.setGeometry(QtCore.QRect(0, 0, 458, 25))
@@ -108,9 +139,13 @@ class UiPDFMerger(object):
         filter_mask = "Python/text files(*.pdf)"
         caption = "Open Files"
         filename = QFileDialog.getOpenFileNames(None, caption, 'str', filter_mask)
-        self.path = filename[0]
-        for i in self.path:
-            self.listWidget.addItem(i)
+        self.path = [p for p in filename[0] if p]
+        if self.path:
+            # One batched insert and a single repaint, even for large selections
+            self.listWidget.setUpdatesEnabled(False)
+            self.listWidget.addItems(self.path)
+            self.listWidget.setUpdatesEnabled(True)
+            self.file_paths.extend(self.path)
 
     def moveUpButtonClicked(self):
         self.currentRow = self.listWidget.currentRow()
@@ -123,6 +158,7 @@ class UiPDFMerger(object):
             else:
                 self.currentItem = self.listWidget.takeItem(self.currentRow)
                 self.listWidget.insertItem(self.currentRow - 1, self.currentItem)
+                self.file_paths.insert(self.currentRow - 1, self.file_paths.pop(self.currentRow))
                 self.currentRow = self.currentRow - 1
                 self.listWidget.setCurrentRow(self.currentRow)
 
@@ -135,37 +171,85 @@ class UiPDFMerger(object):
         else:
             self.currentItem = self.listWidget.takeItem(self.currentRow)
             self.listWidget.insertItem(self.currentRow + 1, self.currentItem)
+            self.file_paths.insert(self.currentRow + 1, self.file_paths.pop(self.currentRow))
             self.currentRow = self.currentRow + 1
             self.listWidget.setCurrentRow(self.currentRow)
 
     def deleteButtonClicked(self):
         self.currentRow = self.listWidget.currentRow()
+        if self.currentRow == -1:
+            return
         self.listWidget.takeItem(self.currentRow)
+        del self.file_paths[self.currentRow]
 
     def outDirButtonClicked(self):
         self.outputfolder = QFileDialog.getExistingDirectory()
-        _translate = QtCore.QCoreApplication.translate
-        self.lineEdit.setText(_translate("PDFMerger", self.outputfolder))
+        self.lineEdit.setText(self.outputfolder)
 
     def mergeButtonClicked(self):
         _translate = QtCore.QCoreApplication.translate
         if self.lineEdit.text() == "":
             self.showdialog("Select Output Directory")
-        else:
-            try:
-
-                if len(self.listWidget) == 0:
-                    self.showdialog("Add PDFs to merge")
-                self.label.setText(_translate("PDF Merger", "Merging... Please wait..."))
-                self.label.setStyleSheet("color:white")
-                self.label.repaint()
-                readFileList = [self.listWidget.item(i).text() for i in range(self.listWidget.count())]
-                pdfmerge.merge(self, readFileList, _translate)
-                self.label.setText(_translate("PDF Merger", "Merged Successfully!"))
-                self.label.setStyleSheet("color:green")
-                self.label.repaint()
-            except Exception as e:
-                print(e)
+            return
+        if not self.file_paths:
+            self.showdialog("Add PDFs to merge")
+            return
+
+        readFileList = list(self.file_paths)
+        mergedfile = str(self.lineEdit.text()) + "/" + str(self.outputFile.text()) + ".pdf"
+        # TODO: Ask for overwrite if file already exists
+        self.label.setText(_translate("PDF Merger", "Merging... Please wait..."))
+        self.label.setStyleSheet("color:white")
+        # One step per input plus one for writing the output
+        self.progressBar.setRange(0, len(readFileList) + 1)
+        self.progressBar.setValue(0)
+        self.progressBar.show()
+        self.btnMerge.setEnabled(False)
+
+        # Run the merge off the GUI thread so the window keeps repainting
+        self._thread = QtCore.QThread()
+        self._worker = MergeWorker(readFileList, mergedfile)
+        self._worker.moveToThread(self._thread)
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self.mergeProgress)
+        self._worker.finished.connect(self.mergeFinished)
+        self._worker.failed.connect(self.mergeFailed)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.failed.connect(self._thread.quit)
+        # Only allow another merge once the thread has actually stopped
+        self._thread.finished.connect(self.mergeThreadFinished)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._thread.start()
+
+    def mergeProgress(self, done, total):
+        self.progressBar.setMaximum(total)
+        self.progressBar.setValue(done)
+
+    def mergeFinished(self, mergedfile):
+        _translate = QtCore.QCoreApplication.translate
+        self.label.setText(_translate("PDF Merger", "Merged Successfully!"))
+        self.label.setStyleSheet("color:green")
+
+    def mergeFailed(self, error):
+        _translate = QtCore.QCoreApplication.translate
+        self.label.setText(_translate("PDF Merger", "Merge failed!"))
+        self.label.setStyleSheet("color:red")
+        self.showdialog(error)
+
+    def mergeThreadFinished(self):
+        self._thread = None
+        self._worker = None
+        self.progressBar.hide()
+        self.btnMerge.setEnabled(True)
+
+    def waitForMerge(self):
+        # Called on quit so a running merge thread is not destroyed under us.
+        # quit() cannot interrupt the worker's run(), so this blocks until
+        # the merge in progress has finished writing its output.
+        if self._thread is not None:
+            self._thread.quit()
+            self._thread.wait()
 
     def showdialog(self, displaytext):
         msg = QMessageBox()
@@ -173,10 +257,8 @@ class UiPDFMerger(object):
         msg.setWindowTitle("Warning")
         msg.setWindowIcon(QIcon('images/warning.png'))
         msg.setText(displaytext)
-        msg.setStandardButtons(QMessageBox.ok)
-        # msg.buttonClicked.connect(msgbtn)
-        # retval = msg.exec_()
-        # print "value of pressed message box button: " + retval
+        msg.setStandardButtons(QMessageBox.Ok)
+        msg.exec_()
 
 
 if __name__ == "__main__":
@@ -226,5 +308,6 @@ if __name__ == "__main__":
     PDFMerger = QtWidgets.QMainWindow()
     ui = UiPDFMerger()
     ui.setupUi(PDFMerger)
+    app.aboutToQuit.connect(ui.waitForMerge)
     PDFMerger.show()
     sys.exit(app.exec_())
@@ -1,11 +1,91 @@
-from PyPDF2 import PdfFileMerger
+import os
+import shutil
+import stat
 
+try:
+    from pypdf import PdfReader as _PdfReader, PdfWriter as _PdfWriter
+except ImportError:
+    try:
+        from PyPDF2 import PdfReader as _PdfReader, PdfWriter as _PdfWriter
+    except ImportError:
+        _PdfReader = _PdfWriter = None
+
+# PdfWriter.append keeps outlines, named destinations and links, which
+# append_pages_from_reader drops; reset_translation lets a cached reader be
+# appended again as a fresh copy. Older PyPDF2 releases without them fall
+# back to the merger, which keeps outlines too.
+if _PdfWriter is None or not all(hasattr(_PdfWriter, name) for name in ("append", "reset_translation")):
+    _PdfWriter = None
+    try:
+        from PyPDF2 import PdfMerger as _PdfMerger
+    except ImportError:
+        from PyPDF2 import PdfFileMerger as _PdfMerger
+
+# Output is written through a large buffer so big merges hit the OS in
+# few, large write() calls rather than many 8 KiB ones
+_WRITE_BUFFER = 1 << 20
+
+
+def merge_pdfs(pdf_paths, out_path, progress=None):
+    # progress, if given, is called as progress(done, total) after each input
+    # and once more after the output is written, the slowest single step
+    # Validate everything up front (one stat per input) so a bad path fails
+    # before any parsing work is done
+    files = []
+    keys = []
+    for raw in pdf_paths:
+        path = os.fspath(raw)
+        st = os.stat(path)
+        if not stat.S_ISREG(st.st_mode):
+            raise ValueError("Not a file: %s" % path)
+        files.append(path)
+        if st.st_ino:
+            keys.append((st.st_dev, st.st_ino, st.st_size))
+        else:
+            # st_ino is only meaningful when non-zero (some Windows and
+            # network filesystems report 0), so fall back to the path
+            keys.append(os.path.normcase(os.path.realpath(path)))
+    total = len(files) + 1
+
+    # A single PDF needs no merging; copy it rather than re-serialise it
+    if len(files) == 1 and files[0].lower().endswith(".pdf"):
+        shutil.copyfile(files[0], out_path)
+        if progress is not None:
+            progress(1, 1)
+        return out_path
+
+    if _PdfWriter is None:
+        merger = _PdfMerger(strict=False)
+        for done, pdf in enumerate(files, 1):
+            merger.append(pdf)
+            if progress is not None:
+                progress(done, total)
+        with open(out_path, "wb", buffering=_WRITE_BUFFER) as out_fh:
+            merger.write(out_fh)
+        merger.close()
+        if progress is not None:
+            progress(total, total)
+        return out_path
+
+    # The writer references every source reader until write(), so peak
+    # memory is the sum of the inputs. A file queued more than once is
+    # parsed once.
+    readers = {}
+    writer = _PdfWriter()
+    for done, (pdf, key) in enumerate(zip(files, keys), 1):
+        reader = readers.get(key)
+        if reader is None:
+            reader = readers[key] = _PdfReader(pdf, strict=False)
+        else:
+            # Otherwise the writer reuses the objects cloned on the first
+            # append, and this copy's outline and links point at that copy
+            writer.reset_translation(reader)
+        writer.append(reader)
+        if progress is not None:
+            progress(done, total)
+    with open(out_path, "wb", buffering=_WRITE_BUFFER) as out_fh:
+        writer.write(out_fh)
+    if progress is not None:
+        progress(total, total)
+    return out_path
 
-def merge(self, readFileList, _translate):
-    merger = PdfFileMerger()
-    for pdf in readFileList:
-        merger.append(pdf)
-    mergedfile = str(self.outputfolder) + "/" + str(self.outputFile.text()) + ".pdf"
-    merger.write(mergedfile)
-    # TODO: Ask for overwrite if file already exists
-    merger.close()
@@ -0,0 +1,28 @@
+import pytest
+
+pypdf = pytest.importorskip("pypdf")
+
+import pdfmerge
+
+
+def _make_pdf(path, pages):
+    writer = pypdf.PdfWriter()
+    for _ in range(pages):
+        writer.add_blank_page(width=72, height=72)
+    writer.add_outline_item("start", 0)
+    with open(path, "wb") as fh:
+        writer.write(fh)
+
+
+def test_duplicate_input_keeps_its_own_outline(tmp_path):
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    _make_pdf(a, 2)
+    _make_pdf(b, 3)
+    out = tmp_path / "out.pdf"
+
+    pdfmerge.merge_pdfs([a, b, a], out)
+
+    reader = pypdf.PdfReader(out)
+    assert len(reader.pages) == 7
+    assert [reader.get_destination_page_number(item) for item in reader.outline] == [0, 2, 5]